@@ -1,26 +1,47 @@
 from fastapi import FastAPI, UploadFile, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-import PyPDF2
 from nlp_processor import extract_keywords, match_resume
+from pdf_text import get_pool, parse_pdf, parse_pdf_in_worker, reset_pool, shutdown_pool
+import asyncio
 import os
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
 from typing import Optional, List, Dict
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Stop PDF worker processes when the app shuts down."""
+    yield
+    shutdown_pool()
+
+
 app = FastAPI(
     title="Resume Parser API",
     description="NLP-powered resume parsing and job matching",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# CORS configuration for frontend
+# CORS configuration for frontend (comma-separated list of origins)
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Max resumes processed at once by the batch endpoint
+RESUME_PARSE_CONCURRENCY = int(os.getenv("RESUME_PARSE_CONCURRENCY", "16"))
+
 
 class JobDescription(BaseModel):
     text: str
@@ -45,6 +66,12 @@ class ResumeResponse(BaseModel):
     match_score: Optional[float] = None
 
 
+class BatchResumeResult(BaseModel):
+    filename: str
+    result: Optional[ResumeResponse] = None
+    error: Optional[str] = None
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -65,6 +92,15 @@ async def parse_resume(
     """
     Parse a PDF resume and optionally match against a job description.
     """
+    return await _process_resume(file, job_desc)
+
+
+async def _process_resume(
+    file: UploadFile,
+    job_desc: str,
+    pdf_in_pool: bool = False
+) -> ResumeResponse:
+    """Run the parse pipeline for one upload; blocking steps stay off the event loop."""
     # Validate file type
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(
@@ -74,7 +110,7 @@ async def parse_resume(
     
     try:
         # Extract text from PDF
-        pdf_text = await extract_pdf_text(file)
+        pdf_text = await extract_pdf_text(file, in_pool=pdf_in_pool)
         
         if not pdf_text.strip():
             raise HTTPException(
@@ -83,18 +119,20 @@ async def parse_resume(
             )
         
         # Extract keywords and skills using NLP
-        resume_data_dict = extract_keywords(pdf_text)
+        resume_data_dict = await asyncio.to_thread(extract_keywords, pdf_text)
         
         # Calculate match score if job description provided
         match_score = None
         if job_desc.strip():
-            match_score = match_resume(resume_data_dict, job_desc)
+            match_score = await asyncio.to_thread(match_resume, resume_data_dict, job_desc)
         
         return ResumeResponse(
             resume_data=resume_data_dict,
             match_score=match_score
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error processing resume: {str(e)}")
         raise HTTPException(
@@ -103,20 +141,60 @@ async def parse_resume(
         )
 
 
-async def extract_pdf_text(file: UploadFile) -> str:
+@app.post("/parse-resumes", response_model=List[BatchResumeResult])
+async def parse_resumes(
+    files: List[UploadFile],
+    job_desc: str = Form(default="")
+):
+    """
+    Parse several PDF resumes, optionally matching each against a job description.
+    PDFs are parsed in parallel in the PDF worker processes; the NLP step runs
+    in threads, so it keeps the event loop free but is still bound by the GIL.
+    Failures are reported per file instead of failing the whole batch.
+    """
+    semaphore = asyncio.Semaphore(RESUME_PARSE_CONCURRENCY)
+    
+    async def parse_one(file: UploadFile) -> ResumeResponse:
+        async with semaphore:
+            return await _process_resume(file, job_desc, pdf_in_pool=True)
+    
+    results = await asyncio.gather(
+        *(parse_one(file) for file in files),
+        return_exceptions=True
+    )
+    
+    batch = []
+    for file, result in zip(files, results):
+        if isinstance(result, HTTPException):
+            batch.append(BatchResumeResult(filename=file.filename, error=result.detail))
+        elif isinstance(result, BaseException):
+            batch.append(BatchResumeResult(filename=file.filename, error=str(result)))
+        else:
+            batch.append(BatchResumeResult(filename=file.filename, result=result))
+    
+    return batch
+
+
+async def extract_pdf_text(file: UploadFile, in_pool: bool = False) -> str:
     """
     Extract text content from a PDF file.
+    With in_pool, the whole document is parsed in a PDF worker process.
     """
     try:
-        pdf_reader = PyPDF2.PdfReader(file.file)
-        text_content = []
-        
-        for page in pdf_reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_content.append(page_text)
-        
-        return " ".join(text_content)
+        data = await file.read()
+        if in_pool:
+            loop = asyncio.get_running_loop()
+            # Retry once on a fresh pool if a worker died
+            for attempt in range(2):
+                pool = get_pool()
+                try:
+                    return await loop.run_in_executor(pool, parse_pdf_in_worker, data)
+                except BrokenProcessPool as e:
+                    reset_pool(pool)
+                    if attempt:
+                        raise RuntimeError("PDF worker process crashed while parsing the document") from e
+        # PDF parsing is blocking, keep it off the event loop
+        return await asyncio.to_thread(parse_pdf, data)
         
     except Exception as e:
         raise HTTPException(
@@ -127,4 +205,12 @@ async def extract_pdf_text(file: UploadFile) -> str:
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    workers = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 2)))
+    # Worker processes read this to size their PDF pools
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers
+    )
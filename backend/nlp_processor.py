@@ -5,24 +5,46 @@ Handles text preprocessing, skill extraction, experience detection,
 resume-to-job matching, and provides improvement suggestions.
 """
 
+import ahocorasick
 import nltk
 import re
-from typing import Dict, List, Set
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+
+def _ensure_nltk_data(resource: str, package: str) -> None:
+    """Download an NLTK package only if it is not already installed."""
+    try:
+        nltk.data.find(resource)
+    except LookupError:
+        nltk.download(package, quiet=True)
+
 
 # Download required NLTK data
-nltk.download('punkt', quiet=True)
-nltk.download('punkt_tab', quiet=True)
-nltk.download('stopwords', quiet=True)
-nltk.download('wordnet', quiet=True)
-nltk.download('averaged_perceptron_tagger', quiet=True)
-
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import stopwords
+_ensure_nltk_data('corpora/stopwords', 'stopwords')
+_ensure_nltk_data('corpora/wordnet', 'wordnet')
+
+from nltk.corpus import stopwords, wordnet
 from nltk.stem import WordNetLemmatizer
 
-# Initialize NLP components
+# Initialize NLP components. WordNet loads lazily and that first load is
+# not thread-safe, so do it here before request threads call the lemmatizer.
+wordnet.ensure_loaded()
 lemmatizer = WordNetLemmatizer()
-stop_words = set(stopwords.words('english'))
+stop_words = frozenset(stopwords.words('english'))
+
+# Alphanumeric runs of 2+ chars; stands in for word_tokenize + isalnum/len filter
+_TOKEN_RE = re.compile(r"[a-z0-9]{2,}")
+# Any alphanumeric run, used for whole-word lookups (single-letter skills like "r")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=100_000)
+def _lemmatize(token: str) -> str:
+    """Cached WordNet lookup - resume vocabulary repeats heavily."""
+    return lemmatizer.lemmatize(token)
 
 # Comprehensive skills list organized by category
 SKILLS_BY_CATEGORY = {
@@ -66,24 +88,49 @@ ALL_SKILLS = []
 for category_skills in SKILLS_BY_CATEGORY.values():
     ALL_SKILLS.extend(category_skills)
 
+# One bit per skill so skill overlap is a single AND + popcount
+_SKILL_BITS = {skill: 1 << index for index, skill in enumerate(ALL_SKILLS)}
+
+_SKILL_TO_CATEGORY = {
+    skill: category
+    for category, skills in SKILLS_BY_CATEGORY.items()
+    for skill in skills
+}
+# Plain words are matched as whole tokens; the rest ("c++", "rest api") as substrings
+_SINGLE_TOKEN_SKILLS = frozenset(skill for skill in ALL_SKILLS if _WORD_RE.fullmatch(skill))
+_MULTI_TOKEN_SKILLS = [skill for skill in ALL_SKILLS if skill not in _SINGLE_TOKEN_SKILLS]
+
 # Patterns for extracting information
 EXPERIENCE_PATTERNS = [
     r'(\d+)\s*\+?\s*(years?|yrs?)\s*(of\s*)?(experience|exp)?',
     r'(experience|exp)\s*:?\s*(\d+)\s*(years?|yrs?)',
     r'(\d+)\s*-\s*\d+\s*(years?|yrs?)',
 ]
+# Applied to lowercased text, so no IGNORECASE needed
+_EXPERIENCE_REGEXES = [re.compile(pattern) for pattern in EXPERIENCE_PATTERNS]
+_QUANT_RE = re.compile(r'\d+%|\$\d+|\d+\s*(users|customers|clients|projects|team|people)')
+# Sentence terminators followed by whitespace, so "asp.net" or emails don't count
+_SENTENCE_END_RE = re.compile(r'[.!?]+(?=\s|$)')
 
 EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
 PHONE_PATTERN = r'[\+]?[(]?[0-9]{1,3}[)]?[-\s\.]?[(]?[0-9]{1,4}[)]?[-\s\.]?[0-9]{1,4}[-\s\.]?[0-9]{1,9}'
 LINKEDIN_PATTERN = r'linkedin\.com/in/[\w-]+'
 GITHUB_PATTERN = r'github\.com/[\w-]+'
 
+# All contact fields in one scan; the group name identifies the field
+_CONTACT_RE = re.compile(
+    f"(?P<email>{EMAIL_PATTERN})|(?P<phone>{PHONE_PATTERN})"
+    f"|(?P<linkedin>{LINKEDIN_PATTERN})|(?P<github>{GITHUB_PATTERN})",
+    re.IGNORECASE
+)
+
 # Education keywords
 EDUCATION_KEYWORDS = [
     "bachelor", "master", "phd", "doctorate", "mba", "b.tech", "m.tech", "b.sc", "m.sc",
     "b.e", "m.e", "bca", "mca", "computer science", "engineering", "university", "college",
     "degree", "diploma", "certification", "certified"
 ]
+DEGREE_KEYWORDS = ["bachelor", "master", "phd", "degree", "b.tech", "m.tech"]
 
 # Action verbs that make resumes stronger
 STRONG_ACTION_VERBS = [
@@ -98,44 +145,124 @@ WEAK_WORDS = [
     "participated", "was involved", "familiar with", "exposure to"
 ]
 
+# Set indexes: single words are looked up in token sets, phrases go through _PHRASES_AC
+_EDUCATION_SINGLE = frozenset(keyword for keyword in EDUCATION_KEYWORDS if _WORD_RE.fullmatch(keyword))
+_DEGREE_KEYWORDS = frozenset(DEGREE_KEYWORDS)
+_STRONG_VERB_SET = frozenset(STRONG_ACTION_VERBS)
+_WEAK_SINGLE = frozenset(word for word in WEAK_WORDS if _WORD_RE.fullmatch(word))
+
+
+def _build_automaton(entries) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton from (word, value) pairs."""
+    automaton = ahocorasick.Automaton()
+    for word, value in entries:
+        automaton.add_word(word, value)
+    automaton.make_automaton()
+    return automaton
+
+
+# Single-pass substring matchers (same semantics as `phrase in text`)
+_SKILLS_AC = _build_automaton((skill, skill) for skill in _MULTI_TOKEN_SKILLS)
+_PHRASES_AC = _build_automaton(
+    [(keyword, ("education", keyword)) for keyword in EDUCATION_KEYWORDS
+     if keyword not in _EDUCATION_SINGLE]
+    + [(word, ("weak_word", word)) for word in WEAK_WORDS if word not in _WEAK_SINGLE]
+)
+
+
+def _find_skills(text_lower: str, words) -> Set[str]:
+    """Skills present in text: whole-word lookup for single tokens, automaton for the rest."""
+    present = set(_SINGLE_TOKEN_SKILLS.intersection(words))
+    present.update(skill for _, skill in _SKILLS_AC.iter(text_lower))
+    return present
+
+
+def _skill_mask(skills) -> int:
+    """Bitmask of the given skills; unknown skills are ignored."""
+    mask = 0
+    for skill in skills:
+        mask |= _SKILL_BITS.get(skill, 0)
+    return mask
+
+
+@lru_cache(maxsize=1024)
+def _job_skill_mask(job_desc: str) -> int:
+    """Bitmask of skills mentioned anywhere in a job description."""
+    job_lower = job_desc.lower()
+    return _skill_mask(_find_skills(job_lower, _WORD_RE.findall(job_lower)))
+
+
+def _count_phrases(text_lower: str) -> Counter:
+    """Count multi-word education keywords and weak phrases in one pass."""
+    return Counter(value for _, value in _PHRASES_AC.iter(text_lower))
+
+
+def _preprocess_lowered(text_lower: str) -> Tuple[str, ...]:
+    """Tokenize, drop stopwords and lemmatize already-lowercased text."""
+    return tuple(_lemmatize(token) for token in _TOKEN_RE.findall(text_lower) if token not in stop_words)
+
+
+@lru_cache(maxsize=1024)
+def _preprocess_cached(text: str) -> Tuple[str, ...]:
+    """Memoized preprocessing; the same job description is reused within a request."""
+    return _preprocess_lowered(text.lower())
+
 
 def preprocess_text(text: str) -> List[str]:
     """Preprocess text for NLP analysis."""
-    text = text.lower()
-    tokens = word_tokenize(text)
-    cleaned_tokens = []
-    for token in tokens:
-        if token.isalnum() and token not in stop_words and len(token) > 1:
-            lemmatized = lemmatizer.lemmatize(token)
-            cleaned_tokens.append(lemmatized)
-    return cleaned_tokens
+    return list(_preprocess_cached(text))
+
+
+@dataclass(frozen=True)
+class ResumeText:
+    """Resume text plus derived forms, computed once and shared by the extractors."""
+    raw: str
+    lower: str
+    tokens: Tuple[str, ...]  # preprocessed: stopwords removed, lemmatized
+    words: Tuple[str, ...]   # every lowercased alphanumeric token
+    token_set: FrozenSet[str]
+    word_counts: Counter
+    phrase_counts: Counter   # multi-word education keywords and weak phrases
+
+    @classmethod
+    def from_text(cls, text: str) -> "ResumeText":
+        lower = text.lower()
+        tokens = _preprocess_lowered(lower)
+        words = tuple(_WORD_RE.findall(lower))
+        return cls(
+            raw=text,
+            lower=lower,
+            tokens=tokens,
+            words=words,
+            token_set=frozenset(tokens),
+            word_counts=Counter(words),
+            phrase_counts=_count_phrases(lower)
+        )
 
 
-def extract_skills(text: str, tokens: List[str]) -> Dict[str, List[str]]:
+def extract_skills(resume_text: ResumeText) -> Dict[str, List[str]]:
     """Extract skills organized by category."""
     found_skills = {}
-    text_lower = text.lower()
-    tokens_text = " ".join(tokens)
+    text_lower = resume_text.lower
+    tokens_text = " ".join(resume_text.tokens)
+    
+    present = _find_skills(text_lower, resume_text.words)
+    present.update(skill for _, skill in _SKILLS_AC.iter(tokens_text))
     
-    for category, skills in SKILLS_BY_CATEGORY.items():
-        category_skills = []
-        for skill in skills:
-            if skill in text_lower or skill in tokens_text:
-                category_skills.append(skill)
-        if category_skills:
-            found_skills[category] = category_skills
+    # Bit order follows the declared order of categories and skills
+    for skill in sorted(present, key=_SKILL_BITS.__getitem__):
+        found_skills.setdefault(_SKILL_TO_CATEGORY[skill], []).append(skill)
     
     return found_skills
 
 
-def extract_experience(text: str) -> str:
+def extract_experience(resume_text: ResumeText) -> str:
     """Extract years of experience from resume text."""
-    text_lower = text.lower()
+    text_lower = resume_text.lower
     max_years = 0
     
-    for pattern in EXPERIENCE_PATTERNS:
-        matches = re.findall(pattern, text_lower, re.IGNORECASE)
-        for match in matches:
+    for regex in _EXPERIENCE_REGEXES:
+        for match in regex.findall(text_lower):
             for group in match:
                 if group and group.isdigit():
                     years = int(group)
@@ -145,77 +272,67 @@ def extract_experience(text: str) -> str:
     return str(max_years)
 
 
-def extract_contact_info(text: str) -> Dict[str, str]:
+def extract_contact_info(resume_text: ResumeText) -> Dict[str, str]:
     """Extract contact information from resume."""
     contact = {}
     
-    email_match = re.search(EMAIL_PATTERN, text)
-    if email_match:
-        contact["email"] = email_match.group()
-    
-    phone_match = re.search(PHONE_PATTERN, text)
-    if phone_match:
-        contact["phone"] = phone_match.group()
-    
-    linkedin_match = re.search(LINKEDIN_PATTERN, text.lower())
-    if linkedin_match:
-        contact["linkedin"] = linkedin_match.group()
-    
-    github_match = re.search(GITHUB_PATTERN, text.lower())
-    if github_match:
-        contact["github"] = github_match.group()
+    for match in _CONTACT_RE.finditer(resume_text.raw):
+        contact.setdefault(match.lastgroup, match.group())
+        if len(contact) == 4:
+            break
     
     return contact
 
 
-def analyze_education(text: str) -> Dict:
+def analyze_education(resume_text: ResumeText) -> Dict:
     """Analyze education section of resume."""
-    text_lower = text.lower()
-    found_education = []
-    
-    for keyword in EDUCATION_KEYWORDS:
-        if keyword in text_lower:
-            found_education.append(keyword)
+    # Lemmatized tokens so "masters" and "degrees" still match
+    present = _EDUCATION_SINGLE.intersection(resume_text.token_set)
+    found_education = [
+        keyword for keyword in EDUCATION_KEYWORDS
+        if keyword in present or resume_text.phrase_counts[("education", keyword)]
+    ]
     
-    has_degree = any(word in text_lower for word in ["bachelor", "master", "phd", "degree", "b.tech", "m.tech"])
+    has_degree = not _DEGREE_KEYWORDS.isdisjoint(found_education)
     
     return {
-        "keywords_found": list(set(found_education)),
+        "keywords_found": found_education,
         "has_degree": has_degree
     }
 
 
-def analyze_resume_quality(text: str) -> Dict:
+def analyze_resume_quality(resume_text: ResumeText) -> Dict:
     """Analyze the quality of the resume content."""
-    text_lower = text.lower()
-    sentences = sent_tokenize(text)
+    text = resume_text.raw
+    text_lower = resume_text.lower
+    word_counts = resume_text.word_counts
     
     # Count action verbs
-    action_verb_count = 0
-    found_action_verbs = []
-    for verb in STRONG_ACTION_VERBS:
-        if verb in text_lower:
-            action_verb_count += text_lower.count(verb)
-            found_action_verbs.append(verb)
+    present_verbs = _STRONG_VERB_SET.intersection(word_counts)
+    found_action_verbs = [verb for verb in STRONG_ACTION_VERBS if verb in present_verbs]
+    action_verb_count = sum(word_counts[verb] for verb in found_action_verbs)
     
     # Count weak words
     weak_word_count = 0
     found_weak_words = []
     for word in WEAK_WORDS:
-        if word in text_lower:
-            weak_word_count += text_lower.count(word)
+        if word in _WEAK_SINGLE:
+            count = word_counts[word]
+        else:
+            count = resume_text.phrase_counts[("weak_word", word)]
+        if count:
+            weak_word_count += count
             found_weak_words.append(word)
     
     # Check for quantifiable achievements
-    numbers_pattern = r'\d+%|\$\d+|\d+\s*(users|customers|clients|projects|team|people)'
-    quantifiable_achievements = len(re.findall(numbers_pattern, text_lower))
+    quantifiable_achievements = len(_QUANT_RE.findall(text_lower))
     
     # Word count analysis
     word_count = len(text.split())
     
     return {
         "word_count": word_count,
-        "sentence_count": len(sentences),
+        "sentence_count": len(_SENTENCE_END_RE.findall(text)),
         "action_verbs_used": found_action_verbs,
         "action_verb_count": action_verb_count,
         "weak_words_found": found_weak_words,
@@ -225,6 +342,28 @@ def analyze_resume_quality(text: str) -> Dict:
     }
 
 
+def _job_match_suggestion(job_tokens: Tuple[str, ...], skills: List[str]) -> Optional[Dict]:
+    """Suggest job description keywords missing from the resume skills, if any."""
+    resume_token_set = frozenset(_preprocess_cached(" ".join(skills)))
+    
+    # Keep job description order so the suggestion is stable across runs
+    missing_keywords = [kw for kw in dict.fromkeys(job_tokens) if kw not in resume_token_set]
+    
+    # Filter to get meaningful missing keywords
+    meaningful_missing = [kw for kw in missing_keywords[:5] if len(kw) > 3]
+    
+    if not meaningful_missing:
+        return None
+    
+    return {
+        "category": "Job Match",
+        "priority": "high",
+        "title": "Add Missing Keywords",
+        "description": f"Consider adding these keywords from the job description: {', '.join(meaningful_missing)}",
+        "impact": f"+{min(len(meaningful_missing) * 3, 15)}% match score"
+    }
+
+
 def generate_suggestions(
     skills_by_category: Dict,
     quality_analysis: Dict,
@@ -309,21 +448,9 @@ def generate_suggestions(
     
     # Job matching suggestions
     if job_desc and match_score < 70:
-        job_tokens = set(preprocess_text(job_desc))
-        resume_tokens = set(preprocess_text(" ".join(all_found_skills)))
-        missing_keywords = job_tokens - resume_tokens
-        
-        # Filter to get meaningful missing keywords
-        meaningful_missing = [kw for kw in list(missing_keywords)[:5] if len(kw) > 3]
-        
-        if meaningful_missing:
-            suggestions.append({
-                "category": "Job Match",
-                "priority": "high",
-                "title": "Add Missing Keywords",
-                "description": f"Consider adding these keywords from the job description: {', '.join(meaningful_missing)}",
-                "impact": f"+{min(len(meaningful_missing) * 3, 15)}% match score"
-            })
+        job_suggestion = _job_match_suggestion(_preprocess_cached(job_desc), all_found_skills)
+        if job_suggestion:
+            suggestions.append(job_suggestion)
     
     # Professional profile suggestions
     suggestions.append({
@@ -391,14 +518,22 @@ def calculate_resume_score(
 
 def extract_keywords(text: str) -> Dict:
     """Main extraction function - extracts all relevant data from resume."""
-    tokens = preprocess_text(text)
+    # Shallow copy: match_resume replaces "suggestions" on the returned dict
+    return dict(_extract_keywords_cached(text))
+
+
+@lru_cache(maxsize=128)
+def _extract_keywords_cached(text: str) -> Dict:
+    """Memoized extraction; re-uploads of the same resume skip all NLP work."""
+    resume_text = ResumeText.from_text(text)
+    tokens = resume_text.tokens
     
     # Extract various components
-    skills_by_category = extract_skills(text, tokens)
-    experience = extract_experience(text)
-    contact = extract_contact_info(text)
-    education = analyze_education(text)
-    quality = analyze_resume_quality(text)
+    skills_by_category = extract_skills(resume_text)
+    experience = extract_experience(resume_text)
+    contact = extract_contact_info(resume_text)
+    education = analyze_education(resume_text)
+    quality = analyze_resume_quality(resume_text)
     
     # Flatten skills for backward compatibility
     all_skills = []
@@ -417,39 +552,45 @@ def extract_keywords(text: str) -> Dict:
         "skills": all_skills,
         "skills_by_category": skills_by_category,
         "experience_years": experience,
-        "keywords": list(set(tokens[:50])),
+        "keywords": list(dict.fromkeys(tokens))[:50],
         "contact": contact,
         "education": education,
         "quality_analysis": quality,
         "resume_score": resume_score,
         "suggestions": suggestions,
-        "word_count": quality["word_count"]
+        "word_count": quality["word_count"],
+        # Precomputed for match_resume; not part of the API response
+        "_token_set": resume_text.token_set.union(all_skills),
+        "_skill_mask": _skill_mask(all_skills)
     }
 
 
 def match_resume(resume_data: Dict, job_desc: str) -> float:
     """Calculate match score between resume and job description."""
-    job_tokens = set(preprocess_text(job_desc))
+    job_tokens = _preprocess_cached(job_desc)
+    job_token_set = frozenset(job_tokens)
     
-    if not job_tokens:
+    if not job_token_set:
         return 0.0
     
-    # Get resume tokens
-    resume_tokens = set(resume_data.get("keywords", []))
-    resume_skills = set(skill.lower() for skill in resume_data.get("skills", []))
-    
-    # Combine resume tokens with skills
-    all_resume_terms = resume_tokens.union(resume_skills)
+    # Resume tokens combined with skills
+    all_resume_terms = resume_data.get("_token_set")
+    if all_resume_terms is None:
+        all_resume_terms = frozenset(resume_data.get("keywords", [])).union(
+            skill.lower() for skill in resume_data.get("skills", [])
+        )
     
     # Calculate intersection
-    matching_terms = job_tokens.intersection(all_resume_terms)
+    matching_terms = job_token_set & all_resume_terms
     
     # Calculate match percentage
-    match_percentage = (len(matching_terms) / len(job_tokens)) * 100
+    match_percentage = (len(matching_terms) / len(job_token_set)) * 100
     
     # Bonus points for skill matches (skills are weighted higher)
-    job_text_lower = job_desc.lower()
-    skill_matches = sum(1 for skill in resume_data.get("skills", []) if skill in job_text_lower)
+    resume_skill_mask = resume_data.get("_skill_mask")
+    if resume_skill_mask is None:
+        resume_skill_mask = _skill_mask(resume_data.get("skills", []))
+    skill_matches = bin(resume_skill_mask & _job_skill_mask(job_desc)).count("1")
     skill_bonus = min(skill_matches * 5, 25)
     
     # Category match bonus
@@ -458,16 +599,16 @@ def match_resume(resume_data: Dict, job_desc: str) -> float:
     
     final_score = min(match_percentage + skill_bonus + category_bonus, 100)
     
-    # Update suggestions with job-specific recommendations
+    # Update suggestions with job-specific recommendations. The other
+    # suggestions don't depend on the job, so only the job match entry changes.
     if "suggestions" in resume_data:
-        job_suggestions = generate_suggestions(
-            skills_by_category,
-            resume_data.get("quality_analysis", {}),
-            resume_data.get("education", {}),
-            resume_data.get("experience_years", "0"),
-            final_score,
-            job_desc
-        )
-        resume_data["suggestions"] = job_suggestions
+        suggestions = [s for s in resume_data["suggestions"] if s["category"] != "Job Match"]
+        if final_score < 70:
+            job_suggestion = _job_match_suggestion(job_tokens, resume_data.get("skills", []))
+            if job_suggestion:
+                # Suggestions are sorted by priority; append after the last high one
+                insert_at = sum(1 for s in suggestions if s["priority"] == "high")
+                suggestions.insert(insert_at, job_suggestion)
+        resume_data["suggestions"] = suggestions[:8]
     
     return round(final_score, 2)
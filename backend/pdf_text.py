@@ -0,0 +1,147 @@
+"""
+PDF Text Extraction
+
+Extracts text from PDF bytes with PDFium. Long documents are split across
+a process pool. This module only depends on pypdfium2 so pool workers
+only load what they need. The exception is a server started with
+`python main.py`: multiprocessing re-imports a script `__main__` in every
+worker, so there each worker also loads the API and the NLP pipeline.
+Run `uvicorn main:app` to avoid that cost.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+import pypdfium2 as pdfium
+
+# PDFs with more pages than this are split across worker processes
+PARALLEL_PAGE_THRESHOLD = 5
+
+
+def _default_pool_size() -> int:
+    """Share the CPUs between uvicorn workers, capped at 4 processes each."""
+    web_workers = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+    return max(1, min(4, (os.cpu_count() or 1) // web_workers))
+
+
+# Worker processes per uvicorn worker (0 or unset: derive from CPU count)
+PDF_POOL_WORKERS = int(os.getenv("PDF_POOL_WORKERS", "0")) or _default_pool_size()
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# PDFium is not thread-safe; serializes in-process parses from the threadpool
+_pdfium_lock = threading.Lock()
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    """Start method for pool workers; never fork the threaded parent."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        # Workers fork from a clean server that has already imported this
+        # module, so starting or replacing one skips the interpreter boot
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["pdf_text"])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Lazily create the process pool used for PDF extraction."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=PDF_POOL_WORKERS,
+                mp_context=_mp_context()
+            )
+        return _pool
+
+
+def reset_pool(broken: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next get_pool() call starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        # Another caller may already have replaced it
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pool() -> None:
+    """Stop the worker processes, if the pool was ever started."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def _extract_pages(pdf: pdfium.PdfDocument, start: int, stop: int) -> List[str]:
+    """Extract non-empty page texts for pages in [start, stop)."""
+    text_content = []
+
+    for index in range(start, stop):
+        page = pdf[index]
+        textpage = page.get_textpage()
+        try:
+            # Skip empty (e.g. scanned) pages without extracting
+            if textpage.count_chars() > 0:
+                text_content.append(textpage.get_text_bounded())
+        finally:
+            # Free native buffers per page to bound memory
+            textpage.close()
+            page.close()
+
+    return text_content
+
+
+def _extract_page_range(data: bytes, start: int, stop: int) -> List[str]:
+    """Worker entry point: re-open the PDF from bytes and extract a page range."""
+    pdf = pdfium.PdfDocument(data)
+    try:
+        return _extract_pages(pdf, start, stop)
+    finally:
+        pdf.close()
+
+
+def parse_pdf_in_worker(data: bytes) -> str:
+    """Worker entry point: parse a whole PDF inside a pool process."""
+    pdf = pdfium.PdfDocument(data)
+    try:
+        return " ".join(_extract_pages(pdf, 0, len(pdf)))
+    finally:
+        pdf.close()
+
+
+def parse_pdf(data: bytes) -> str:
+    """Parse PDF bytes and join the text of all pages."""
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(data)
+        try:
+            page_count = len(pdf)
+            if page_count <= PARALLEL_PAGE_THRESHOLD:
+                return " ".join(_extract_pages(pdf, 0, page_count))
+        finally:
+            pdf.close()
+
+    # One contiguous page range per worker, results kept in page order
+    workers = min(PDF_POOL_WORKERS, page_count)
+    step = -(-page_count // workers)
+    # A worker that dies (PDFium crash, OOM kill) breaks the whole pool;
+    # retry once on a fresh one before giving up
+    for attempt in range(2):
+        pool = get_pool()
+        try:
+            futures: List[Future] = [
+                pool.submit(_extract_page_range, data, start, min(start + step, page_count))
+                for start in range(0, page_count, step)
+            ]
+            return " ".join(text for future in futures for text in future.result())
+        except BrokenProcessPool as e:
+            reset_pool(pool)
+            if attempt:
+                raise RuntimeError("PDF worker process crashed while parsing the document") from e
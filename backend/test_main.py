@@ -0,0 +1,50 @@
+"""
+Tests for the API endpoints
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import pdf_text
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as client:
+        yield client
+    pdf_text.shutdown_pool()
+
+
+def test_parse_resumes_reports_errors_per_file(client, make_pdf):
+    files = [
+        ("files", ("valid.pdf", make_pdf(["Python developer with AWS and Docker"]), "application/pdf")),
+        ("files", ("notes.txt", b"Python developer", "text/plain")),
+        ("files", ("broken.pdf", b"not really a pdf", "application/pdf")),
+        ("files", ("blank.pdf", make_pdf([""]), "application/pdf")),
+    ]
+    response = client.post("/parse-resumes", files=files, data={"job_desc": "Python developer"})
+    assert response.status_code == 200
+
+    valid, text_file, broken, blank = response.json()
+    assert valid["error"] is None
+    assert valid["result"]["resume_data"]["skills"] == ["python", "aws", "docker"]
+    assert valid["result"]["match_score"] is not None
+
+    assert text_file == {"filename": "notes.txt", "result": None, "error": "Only PDF files are supported"}
+
+    assert broken["result"] is None
+    assert broken["error"].startswith("Error reading PDF: ")
+    assert broken["error"] != "Error reading PDF: "
+
+    assert blank["result"] is None
+    assert blank["error"].startswith("Could not extract text from PDF")
+
+
+def test_parse_resume_keeps_status_and_detail_of_pdf_errors(client):
+    response = client.post(
+        "/parse-resume",
+        files={"file": ("broken.pdf", b"not really a pdf", "application/pdf")}
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Error reading PDF: ")
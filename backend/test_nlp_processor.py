@@ -0,0 +1,102 @@
+"""
+Tests for nlp_processor
+
+Pins the matching rules the extractors rely on: whole-word skill and verb
+matching, lemma-based education keywords, contact extraction and where
+the job-match suggestion lands.
+"""
+
+from nlp_processor import (
+    ResumeText,
+    analyze_education,
+    analyze_resume_quality,
+    extract_contact_info,
+    extract_keywords,
+    extract_skills,
+    match_resume,
+)
+
+
+def _skills(text: str) -> dict:
+    return extract_skills(ResumeText.from_text(text))
+
+
+def test_single_word_skills_match_whole_words_only():
+    skills = _skills("Googled answers, maintained servers, drove a car.")
+    assert skills == {}
+
+
+def test_single_letter_and_short_skills_match_as_words():
+    skills = _skills("Languages: Python, Go and R. Built AI tooling.")
+    assert skills["programming_languages"] == ["python", "go", "r"]
+    assert skills["data_ml"] == ["ai"]
+
+
+def test_punctuated_and_multi_word_skills_match_as_substrings():
+    skills = _skills("Wrote C++ services behind a REST API; problem-solving mindset.")
+    assert skills["programming_languages"] == ["c++"]
+    assert skills["tools_practices"] == ["rest api"]
+    assert skills["soft_skills"] == ["problem solving"]
+
+
+def test_skills_follow_declared_category_order():
+    skills = _skills("Docker, Django and Python")
+    assert list(skills) == ["programming_languages", "web_technologies", "cloud_devops"]
+
+
+def test_education_matches_lemmas_not_substrings():
+    education = analyze_education(ResumeText.from_text("Masters in Computer Science, B.Tech"))
+    assert education["keywords_found"] == ["master", "b.tech", "computer science"]
+    assert education["has_degree"] is True
+
+    education = analyze_education(ResumeText.from_text("Mastered the guitar"))
+    assert education == {"keywords_found": [], "has_degree": False}
+
+
+def test_contact_info_keeps_case_and_ignores_digits_in_email():
+    contact = extract_contact_info(ResumeText.from_text(
+        "jane2020@mail.com | +1 555-123-4567 | linkedin.com/in/JaneDoe | GitHub.com/JDoe"
+    ))
+    assert contact == {
+        "email": "jane2020@mail.com",
+        "phone": "+1 555-123-4567",
+        "linkedin": "linkedin.com/in/JaneDoe",
+        "github": "GitHub.com/JDoe",
+    }
+
+
+def test_action_verbs_are_counted_as_whole_words():
+    quality = analyze_resume_quality(ResumeText.from_text(
+        "Led the team. Called vendors and handled tickets. Led releases."
+    ))
+    assert quality["action_verbs_used"] == ["led"]
+    assert quality["action_verb_count"] == 2
+
+
+def test_job_match_suggestion_is_spliced_after_high_priority_entries():
+    resume_data = extract_keywords("Helped with Python scripts.")
+    job_desc = "Seeking backend engineer with terraform observability expertise"
+
+    match_resume(resume_data, job_desc)
+    match_resume(resume_data, job_desc)
+
+    suggestions = resume_data["suggestions"]
+    categories = [s["category"] for s in suggestions]
+    assert categories.count("Job Match") == 1
+
+    position = categories.index("Job Match")
+    priorities = [s["priority"] for s in suggestions]
+    assert all(p == "high" for p in priorities[:position])
+    assert all(p != "high" for p in priorities[position + 1:])
+    assert suggestions[position]["description"].endswith("seeking, backend, engineer, terraform, observability")
+
+
+def test_extract_keywords_is_deterministic_and_not_shared_with_cache():
+    text = "Python developer. Developed Python services and led teams."
+    first = extract_keywords(text)
+    first["suggestions"] = []
+
+    second = extract_keywords(text)
+    assert second["suggestions"]
+    assert second["keywords"] == list(dict.fromkeys(second["keywords"]))
+    assert second["keywords"][:3] == ["python", "developer", "developed"]
@@ -0,0 +1,35 @@
+"""
+Tests for pdf_text
+"""
+
+import pdf_text
+
+
+def test_short_pdf_is_parsed_in_process(make_pdf):
+    assert pdf_text.parse_pdf(make_pdf(["Python developer", "Led teams"])) == "Python developer Led teams"
+
+
+def test_long_pdf_keeps_page_order_across_workers(make_pdf):
+    pages = [f"Page {i}" for i in range(12)]
+    try:
+        assert pdf_text.parse_pdf(make_pdf(pages)) == " ".join(pages)
+    finally:
+        pdf_text.shutdown_pool()
+
+
+def test_pool_is_rebuilt_after_a_worker_dies(make_pdf):
+    pages = [f"Page {i}" for i in range(12)]
+    data = make_pdf(pages)
+    try:
+        pool = pdf_text.get_pool()
+        assert pdf_text.parse_pdf(data) == " ".join(pages)
+
+        # Simulate a worker crash (e.g. PDFium segfault or OOM kill)
+        for process in list(pool._processes.values()):
+            process.kill()
+            process.join()
+
+        assert pdf_text.parse_pdf(data) == " ".join(pages)
+        assert pdf_text.get_pool() is not pool
+    finally:
+        pdf_text.shutdown_pool()